@@ -1,22 +1,44 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import inspect
+import io
+import itertools
 import json
 import logging
 import logging.handlers
+import os
+import pickle
 import platform
 import random
+import re
 import smtplib
+import sqlite3
+import subprocess
 import sys
+import threading
 import time
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import List, TypedDict, Dict, Set
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, Iterable, List, Mapping, Optional, Set, Tuple, Dict
 
+import ahocorasick
+import aiohttp
+from aiolimiter import AsyncLimiter
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -25,8 +47,52 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
-
-class Beer(TypedDict):
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+]
+
+# Number of Chrome WebDrivers used in parallel when falling back to Selenium
+SELENIUM_WORKERS = 4
+
+# Seconds between requests to Untappd, to avoid being detected as a bot
+UNTAPPD_REQUEST_INTERVAL = 10
+
+# Subresources the Selenium fallback doesn't need to read the beer list
+BLOCKED_RESOURCE_URLS = ['*.css', '*.css?*', '*.woff', '*.woff?*', '*.woff2', '*.woff2?*', '*.ttf', '*.ttf?*']
+
+# Only build the parts of the page holding the brewery name and the beer list
+BEER_PAGE_STRAINER = SoupStrainer('div', attrs={'class': re.compile(r'beer-item|name')})
+# Compiled once instead of on every select call
+BEER_ITEM_SELECTOR = soupsieve.compile('div[class*="beer-item"]')
+BREWERY_NAME_SELECTOR = soupsieve.compile('div[class*="name"] h1')
+
+# Extracts the brewery name and its beers inside the browser, so only the
+# values we need cross the WebDriver connection instead of the whole page
+EXTRACT_BEERS_SCRIPT = """
+const breweryCard = document.querySelector('div[class*="name"]');
+const breweryName = breweryCard && breweryCard.querySelector('h1');
+const beers = Array.from(document.querySelectorAll('div[class*="beer-item"]')).map(card => ({
+    name: card.querySelector('p[class*="name"]')?.textContent.trim(),
+    style: card.querySelector('p[class*="style"]')?.textContent.trim(),
+})).filter(beer => beer.name && beer.style);
+return {brewery: breweryName ? breweryName.textContent.trim() : null, beers: beers};
+"""
+
+CACHE_DIR = Path.home() / '.cache' / 'beer_finder'
+CHROMEDRIVER_PATH_CACHE = CACHE_DIR / 'chromedriver_path'
+# Bump the version whenever the cached Beer format changes, so older entries are ignored
+BREWERY_CACHE_DIR = CACHE_DIR / 'brewery' / 'v2'
+# Persistent Chrome profiles and HTTP caches, so static assets are reused across pages and runs.
+# Chrome locks its profile, so every parallel driver gets its own subdirectory.
+CHROME_PROFILE_DIR = CACHE_DIR / 'chrome-profile'
+CHROME_DISK_CACHE_DIR = CACHE_DIR / 'chrome-cache'
+CHROME_DISK_CACHE_SIZE = 50 * 1024 * 1024
+
+
+@dataclass(slots=True, frozen=True)
+class Beer:
     """Type definition for beer information."""
     name: str
     style: str
@@ -34,39 +100,89 @@ class Beer(TypedDict):
     brewery_id: str
 
 
-def load_sent_beers() -> Dict[str, Set[str]]:
-    """Load the set of already sent beer names for each brewery."""
-    try:
-        with open('sent_beers.json', 'r') as f:
-            data = json.load(f)
-            # Convert lists back to sets
-            return {brewery_id: set(beers) for brewery_id, beers in data.items()}
-    except FileNotFoundError:
-        return {}
+SENT_BEERS_DB_PATH = Path('sent_beers.db')
+# Older versions kept the sent beers in this file, it is imported into the database once
+SENT_BEERS_JSON_PATH = Path('sent_beers.json')
+
+
+class SentBeerStore:
+    """Names of the beers that have already been sent for each brewery, stored in SQLite."""
+
+    def __init__(self, path: Path = SENT_BEERS_DB_PATH) -> None:
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sent("
+                "brewery_id TEXT, name TEXT, PRIMARY KEY(brewery_id, name)"
+                ") WITHOUT ROWID"
+            )
+
+        if SENT_BEERS_JSON_PATH.exists() and self._is_empty():
+            self._import_json(SENT_BEERS_JSON_PATH)
+
+    def __enter__(self) -> SentBeerStore:
+        return self
 
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-def save_sent_beers(sent_beers: Dict[str, Set[str]]) -> None:
-    """Save the set of sent beer names for each brewery to a file."""
-    # Convert sets to lists for JSON serialization
-    data = {brewery_id: list(beers) for brewery_id, beers in sent_beers.items()}
-    with open('sent_beers.json', 'w') as f:
-        json.dump(data, f, indent=2)
+    def _is_empty(self) -> bool:
+        return self._connection.execute("SELECT 1 FROM sent LIMIT 1").fetchone() is None
 
+    def _import_json(self, path: Path) -> None:
+        """Import the sent beers from the JSON file used by older versions."""
+        data = orjson.loads(path.read_bytes())
+        for brewery_id, names in data.items():
+            self.add_many(brewery_id, names)
+        logging.info(f"Imported sent beers for {len(data)} breweries from {path}")
 
-def filter_new_beers(beers: List[Beer], sent_beers: Dict[str, Set[str]], brewery_id: str) -> List[Beer]:
+    def names(self, brewery_id: str) -> Set[str]:
+        """Get the names of all beers from a brewery that have already been sent."""
+        rows = self._connection.execute("SELECT name FROM sent WHERE brewery_id = ?", (brewery_id,))
+        return {name for (name,) in rows}
+
+    def add_many(self, brewery_id: str, names: Iterable[str]) -> None:
+        """Mark beers from a brewery as sent, in a single transaction."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO sent(brewery_id, name) VALUES (?, ?)",
+                ((brewery_id, name) for name in names)
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def filter_new_beers(beers: List[Beer], sent_beers: SentBeerStore, brewery_id: str) -> List[Beer]:
     """Filter out beers that have already been sent."""
-    new_beers = []
-    for beer in beers:
-        if beer['name'] not in sent_beers.get(brewery_id, set()):
-            new_beers.append(beer)
-    return new_beers
+    already_sent = sent_beers.names(brewery_id)
+    return [beer for beer in beers if beer.name not in already_sent]
+
 
+def build_style_matcher(desired_styles: List[str]) -> Optional[ahocorasick.Automaton]:
+    """Build an automaton that finds any of the desired styles in a single pass over a beer style.
 
-def load_config() -> dict:
-    """Load configuration from config.json"""
+    Returns None if there are no desired styles, since an empty automaton can't be searched.
+    """
+    if not desired_styles:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for style in desired_styles:
+        automaton.add_word(style, style)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Mapping[str, Any]:
+    """Load configuration from config.json
+
+    The file is only read once per run, so the result is returned read-only.
+    """
     try:
         with open('config.json', 'r') as f:
-            return json.load(f)
+            return MappingProxyType(json.load(f))
     except FileNotFoundError:
         logging.error("config.json not found. Please make sure it exists in the root directory.")
         exit(1)
@@ -75,10 +191,50 @@ def load_config() -> dict:
         exit(1)
 
 
-def setup_driver() -> WebDriver:
+def get_chrome_major_version() -> Optional[str]:
+    """Get the major version of the installed Chrome on Windows, or None if it can't be determined"""
+    try:
+        result = subprocess.run(
+            ['reg', 'query', r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', '/v', 'version'],
+            capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    match = re.search(r'(\d+)\.\d+\.\d+\.\d+', result.stdout)
+    return match.group(1) if match else None
+
+
+def get_chromedriver_path() -> str:
+    """Get the ChromeDriver path, only asking ChromeDriverManager when Chrome's major version changed"""
+    chrome_version = get_chrome_major_version()
+
+    try:
+        cached_version, cached_path = CHROMEDRIVER_PATH_CACHE.read_text().splitlines()
+    except (FileNotFoundError, ValueError):
+        pass
+    else:
+        # If the Chrome version can't be read, trust the cached driver as long as it still exists
+        if chrome_version in (None, cached_version) and Path(cached_path).exists():
+            return cached_path
+
+    driver_path = ChromeDriverManager().install()
+    try:
+        CHROMEDRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CHROMEDRIVER_PATH_CACHE.write_text(f"{chrome_version or ''}\n{driver_path}")
+    except OSError as e:
+        # The driver is installed, only the next run has to resolve it again
+        logging.warning(f"Could not cache the ChromeDriver path: {e}")
+    return driver_path
+
+
+def setup_driver(worker_id: int = 0) -> WebDriver:
     """Setup Chrome WebDriver with anti-detection options"""
     chrome_options = Options()
 
+    # Return from driver.get() once the DOM is ready instead of waiting for every subresource
+    chrome_options.page_load_strategy = 'eager'
+
     # Headless mode (using newer syntax for better compatibility)
     chrome_options.add_argument("--headless=new")
     chrome_options.add_argument("--disable-gpu")
@@ -90,17 +246,22 @@ def setup_driver() -> WebDriver:
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
 
+    # Reuse the HTTP cache between pages and runs
+    chrome_options.add_argument(f"--user-data-dir={CHROME_PROFILE_DIR / f'worker-{worker_id}'}")
+    chrome_options.add_argument(f"--disk-cache-dir={CHROME_DISK_CACHE_DIR / f'worker-{worker_id}'}")
+    chrome_options.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_SIZE}")
+
+    # Only the text of the beer list is needed, so don't load images
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+    })
+
     # User agent
-    user_agents = [
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
-    ]
-    chrome_options.add_argument(f"--user-agent={random.choice(user_agents)}")
+    chrome_options.add_argument(f"--user-agent={random.choice(USER_AGENTS)}")
 
     try:
         if platform.system() == "Windows":
-            service = Service(ChromeDriverManager().install())
+            service = Service(get_chromedriver_path())
         else:
             # Use a fixed path for non-Windows systems because it will install x64 which doesn't work on raspberry pi
             service = Service("/usr/bin/chromedriver")
@@ -109,6 +270,10 @@ def setup_driver() -> WebDriver:
         # Execute script to remove webdriver property
         web_driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
+        # Chrome has no content setting for stylesheets or fonts, so block them by URL instead
+        web_driver.execute_cdp_cmd('Network.enable', {})
+        web_driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
+
         return web_driver
 
     except Exception as e:
@@ -118,119 +283,329 @@ def setup_driver() -> WebDriver:
         raise
 
 
-def get_beers_from_brewery(brewery_id: str) -> List[Beer]:
-    """Scrape beer information from a brewery's Untappd page using Selenium"""
-    base_url = f"https://untappd.com/{brewery_id}/beer?sort=created_at_desc"
-    driver = None
+def disk_memoize(ttl_hours: float, cache_dir: Path, key: Callable[..., Hashable]):
+    """Cache a function's results on disk for the current day, at most ttl_hours long.
+
+    The cache key is built from key(*args, **kwargs) and today's date, so functions
+    decorated with the same cache_dir and key share their results. Empty results are
+    not cached so failed lookups are retried. Delete cache_dir to invalidate the cache.
+    Works for both regular and async functions.
+    """
+    missing = object()
+
+    def cache_paths(cache_key: Hashable) -> Tuple[Path, Path]:
+        digest = hashlib.blake2b(repr((cache_key, date.today().isoformat())).encode(), digest_size=16).hexdigest()
+        return cache_dir / f"{digest}.pkl", cache_dir / f"{digest}.json"
+
+    def load(cache_key: Hashable) -> Any:
+        data_path, meta_path = cache_paths(cache_key)
+        try:
+            meta = orjson.loads(meta_path.read_bytes())
+            if time.time() - meta['created_at'] > ttl_hours * 3600:
+                return missing
+            result = pickle.loads(data_path.read_bytes())
+        except Exception as e:
+            # A missing, corrupt or stale entry (e.g. pickled classes that moved) is just a cache miss
+            if not isinstance(e, FileNotFoundError):
+                logging.warning(f"Ignoring unreadable cache entry for {cache_key}: {e}")
+            return missing
+
+        logging.info(f"Using cached result for {cache_key}")
+        return result
+
+    def store(cache_key: Hashable, result: Any) -> None:
+        if not result:
+            return
+
+        data_path, meta_path = cache_paths(cache_key)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to temporary files first so a crash can't leave a half-written entry behind
+            for path, content in (
+                (data_path, pickle.dumps(result)),
+                (meta_path, orjson.dumps({'key': repr(cache_key), 'created_at': time.time()})),
+            ):
+                temp_path = path.with_name(path.name + '.tmp')
+                temp_path.write_bytes(content)
+                os.replace(temp_path, path)
+        except OSError as e:
+            # Caching is best-effort, the fresh result is still returned
+            logging.warning(f"Could not write cache entry for {cache_key}: {e}")
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = key(*args, **kwargs)
+                result = load(cache_key)
+                if result is missing:
+                    result = await func(*args, **kwargs)
+                    store(cache_key, result)
+                return result
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            result = load(cache_key)
+            if result is missing:
+                result = func(*args, **kwargs)
+                store(cache_key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def get_brewery_url(brewery_id: str) -> str:
+    """Build the URL of a brewery's Untappd beer list, newest first"""
+    return f"https://untappd.com/{brewery_id}/beer?sort=created_at_desc"
+
+
+def parse_beers(html: str, brewery_id: str) -> Optional[List[Beer]]:
+    """Parse beer information from a brewery's Untappd page.
+
+    Returns None if the page does not contain a beer list.
+    """
+    soup = BeautifulSoup(html, 'lxml', parse_only=BEER_PAGE_STRAINER)
+
+    beer_cards = BEER_ITEM_SELECTOR.select(soup)
+    if not beer_cards:
+        return None
+
+    # Brewery names, ids and styles repeat across beers, so share one copy of each
+    brewery_name = sys.intern(BREWERY_NAME_SELECTOR.select_one(soup).get_text(strip=True))
+    brewery_id = sys.intern(brewery_id)
+
+    beers = []
+    for card in beer_cards:
+        try:
+            # Find the name and style paragraphs in a single walk over the card
+            beer_name = beer_style = None
+            for paragraph in card.find_all('p'):
+                css_class = ' '.join(paragraph.get('class') or ())
+                if beer_name is None and 'name' in css_class:
+                    beer_name = paragraph.get_text(strip=True)
+                elif beer_style is None and 'style' in css_class:
+                    beer_style = paragraph.get_text(strip=True)
+
+            if beer_name and beer_style:
+                beers.append(Beer(
+                    name=beer_name,
+                    style=sys.intern(beer_style),
+                    brewery=brewery_name,
+                    brewery_id=brewery_id
+                ))
+        except Exception as e:
+            logging.warning(f"Error parsing beer card: {e}")
+            continue
+
+    return beers
+
+
+@disk_memoize(ttl_hours=12, cache_dir=BREWERY_CACHE_DIR, key=lambda session, rate_limiter, brewery_id: brewery_id)
+async def get_beers_from_brewery(
+    session: aiohttp.ClientSession, rate_limiter: AsyncLimiter, brewery_id: str
+) -> Optional[List[Beer]]:
+    """Scrape beer information from a brewery's Untappd page using a plain HTTP request.
+
+    Returns None if the page could not be read without a browser, in which case
+    get_beers_from_brewery_selenium should be used instead.
+    """
+    base_url = get_brewery_url(brewery_id)
 
     try:
-        driver = setup_driver()
-        driver.get(base_url)
-
-        # Wait for the page to load and for beer items to be present
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='beer-item']"))
-        )
-
-        # Get the page source and parse with BeautifulSoup
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-        brewery_card = soup.select_one('div[class*="name"]')
-        brewery_name = brewery_card.select_one('h1').get_text(strip=True)
+        async with rate_limiter:
+            logging.info(f"Checking beers from brewery: {brewery_id}")
+            async with session.get(base_url) as response:
+                if response.status == 403:
+                    logging.warning(f"Request for brewery {brewery_id} was blocked, falling back to Selenium")
+                    return None
+                response.raise_for_status()
+                html = await response.text()
+
+        beers = parse_beers(html, brewery_id)
+        if beers is None:
+            logging.warning(f"No beer list found for brewery {brewery_id}, falling back to Selenium")
+        return beers
 
-        beers = []
-        beer_cards = soup.select('div[class*="beer-item"]')
+    except Exception as e:
+        logging.error(f"Error fetching data from Untappd: {e}", exc_info=True)
+        return []
 
-        for card in beer_cards:
-            try:
-                name_elem = card.select_one('p[class*="name"]')
-                style_elem = card.select_one('p[class*="style"]')
 
-                if name_elem and style_elem:
-                    beer_name = name_elem.get_text(strip=True)
-                    beer_style = style_elem.get_text(strip=True)
+@disk_memoize(ttl_hours=12, cache_dir=BREWERY_CACHE_DIR, key=lambda driver, brewery_id: brewery_id)
+def get_beers_from_brewery_selenium(driver: WebDriver, brewery_id: str) -> List[Beer]:
+    """Scrape beer information from a brewery's Untappd page using Selenium"""
+    base_url = get_brewery_url(brewery_id)
 
-                    beers.append({
-                        'name': beer_name,
-                        'style': beer_style,
-                        'brewery': brewery_name,
-                        'brewery_id': brewery_id
-                    })
-            except Exception as e:
-                logging.warning(f"Error parsing beer card: {e}")
-                continue
+    try:
+        driver.get(base_url)
 
-        return beers
+        # The beer list is usually there as soon as the DOM is ready, only poll for it if not
+        if not driver.execute_script("return document.querySelector(\"div[class*='beer-item']\") !== null"):
+            WebDriverWait(driver, 20, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='beer-item']"))
+            )
+
+        page = driver.execute_script(EXTRACT_BEERS_SCRIPT)
+        if not page['brewery']:
+            raise ValueError(f"Brewery name not found on page for {brewery_id}")
+
+        brewery_name = sys.intern(page['brewery'])
+        brewery_id = sys.intern(brewery_id)
+        return [
+            Beer(
+                name=beer['name'],
+                style=sys.intern(beer['style']),
+                brewery=brewery_name,
+                brewery_id=brewery_id
+            )
+            for beer in page['beers']
+        ]
 
     except Exception as e:
         logging.error(f"Error fetching data from Untappd: {e}", exc_info=True)
+        if isinstance(e, WebDriverException) and not isinstance(e, TimeoutException):
+            # The driver itself is probably broken, let the caller replace it
+            raise
         return []
     finally:
-        if driver:
+        # Start the next brewery with a clean session instead of restarting Chrome
+        try:
+            driver.delete_all_cookies()
+        except Exception as e:
+            logging.warning(f"Error clearing cookies after brewery {brewery_id}: {e}")
+
+
+async def get_beers_with_selenium(brewery_ids: List[str], rate_limiter: AsyncLimiter) -> Dict[str, List[Beer]]:
+    """Scrape several breweries with a few Chrome WebDrivers in parallel.
+
+    Every worker thread starts its own driver on first use and reuses it for the
+    following breweries.
+    """
+    thread_state = threading.local()
+    worker_ids = itertools.count()
+    drivers = []
+
+    def quit_driver(driver: WebDriver) -> None:
+        try:
             driver.quit()
+        except Exception as e:
+            logging.warning(f"Error quitting Chrome WebDriver: {e}")
+
+    def discard_driver(driver: WebDriver) -> None:
+        """Drop this thread's driver so the next brewery starts a fresh one."""
+        thread_state.driver = None
+        drivers.remove(driver)
+        quit_driver(driver)
+
+    def scrape(brewery_id: str) -> List[Beer]:
+        driver = getattr(thread_state, 'driver', None)
+        try:
+            if driver is None:
+                driver = setup_driver(next(worker_ids))
+                thread_state.driver = driver
+                drivers.append(driver)
+
+            logging.info(f"Checking beers from brewery with Selenium: {brewery_id}")
+            return get_beers_from_brewery_selenium(driver, brewery_id)
+
+        except WebDriverException as e:
+            logging.error(f"Chrome WebDriver failed while checking brewery {brewery_id}: {e}")
+            if driver is not None:
+                discard_driver(driver)
+            return []
+        except Exception as e:
+            logging.error(f"Error checking brewery {brewery_id} with Selenium: {e}")
+            return []
+
+    loop = asyncio.get_running_loop()
+
+    async def fetch(executor: ThreadPoolExecutor, brewery_id: str) -> List[Beer]:
+        # The rate limiter staggers the starts, the pages then load in parallel
+        async with rate_limiter:
+            return await loop.run_in_executor(executor, scrape, brewery_id)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(SELENIUM_WORKERS, len(brewery_ids))) as executor:
+            results = await asyncio.gather(*(fetch(executor, brewery_id) for brewery_id in brewery_ids))
+    finally:
+        for driver in drivers:
+            quit_driver(driver)
+
+    return dict(zip(brewery_ids, results))
 
 
-def find_matching_beers() -> List[Beer]:
+async def find_matching_beers() -> List[Beer]:
     """Find beers that match the desired styles from config"""
     config = load_config()
     brewery_ids = config.get('brewery_ids', [])
 
     # Don't worry about case
     desired_styles = [style.lower() for style in config.get('desired_styles', [])]
+    style_matcher = build_style_matcher(desired_styles)
+
+    # Most beers share a handful of styles, so only lowercase and search each style once
+    @lru_cache(maxsize=None)
+    def is_desired_style(style: str) -> bool:
+        return style_matcher is not None and next(style_matcher.iter(style.lower()), None) is not None
 
-    # Load previously sent beers
-    sent_beers = load_sent_beers()
     new_beers = []
 
-    for brewery_id in brewery_ids:
-        # Sleep between requests to avoid being detected as a bot
-        sleep_time = random.uniform(5.0, 35.0)
-        logging.info(f"Sleeping for {sleep_time:.2f} seconds before checking brewery: {brewery_id}")
-        time.sleep(sleep_time)
-        logging.info(f"Checking beers from brewery: {brewery_id}")
-        beers = get_beers_from_brewery(brewery_id)
-        logging.info(f"Found {len(beers)} beers from brewery {brewery_id}")
-
-        # Filter for matching styles and new beers
-        matching_beers = []
-        for beer in beers:
-            if any(style in beer['style'].lower() for style in desired_styles):
-                matching_beers.append(beer)
-
-        # Filter out already sent beers
-        new_brewery_beers = filter_new_beers(matching_beers, sent_beers, brewery_id)
-        new_beers.extend(new_brewery_beers)
-
-        # Update sent_beers with new beers
-        if new_brewery_beers:
-            if brewery_id not in sent_beers:
-                sent_beers[brewery_id] = set()
-            sent_beers[brewery_id].update(beer['name'] for beer in new_brewery_beers)
-
-    # Save the updated sent_beers to disk
-    if new_beers:
-        save_sent_beers(sent_beers)
+    # The rate limiter staggers the requests, which then run concurrently with each other.
+    # It belongs to the running event loop, so it is created per run.
+    rate_limiter = AsyncLimiter(1, UNTAPPD_REQUEST_INTERVAL)
+
+    async with aiohttp.ClientSession(
+        headers={'User-Agent': random.choice(USER_AGENTS)},
+        timeout=aiohttp.ClientTimeout(total=30),
+    ) as session:
+        results = await asyncio.gather(
+            *(get_beers_from_brewery(session, rate_limiter, brewery_id) for brewery_id in brewery_ids)
+        )
+
+    fallback_ids = [brewery_id for brewery_id, beers in zip(brewery_ids, results) if beers is None]
+    selenium_results = await get_beers_with_selenium(fallback_ids, rate_limiter) if fallback_ids else {}
+
+    with SentBeerStore() as sent_beers:
+        for brewery_id, beers in zip(brewery_ids, results):
+            if beers is None:
+                beers = selenium_results[brewery_id]
+            logging.info(f"Found {len(beers)} beers from brewery {brewery_id}")
+
+            # Filter for matching styles and new beers
+            matching_beers = [beer for beer in beers if is_desired_style(beer.style)]
+
+            # Filter out already sent beers
+            new_brewery_beers = filter_new_beers(matching_beers, sent_beers, brewery_id)
+            new_beers.extend(new_brewery_beers)
+
+            # Remember the new beers so they aren't sent again
+            if new_brewery_beers:
+                sent_beers.add_many(brewery_id, (beer.name for beer in new_brewery_beers))
 
     return new_beers
 
 
 def format_beer_list(beers: List[Beer]) -> str:
     """Format the list of beers as a string."""
-    beers_by_brewery = {}
+    beers_by_brewery = defaultdict(list)
     for beer in beers:
-        if beer['brewery'] not in beers_by_brewery:
-            beers_by_brewery[beer['brewery']] = []
-        beers_by_brewery[beer['brewery']].append(beer)
+        beers_by_brewery[beer.brewery].append(beer)
 
-    result = []
+    result = io.StringIO()
     for brewery, brewery_beers in beers_by_brewery.items():
-        result.append(f"{brewery}")
-        result.append("-" * len(brewery))
+        result.write(f"{brewery}\n")
+        result.write("-" * len(brewery) + "\n")
         for beer in brewery_beers:
-            result.append(f"{beer['name']} | {beer['style']}")
-        result.append("")  # Add empty line between breweries
+            result.write(f"{beer.name} | {beer.style}\n")
+        result.write("\n")  # Add empty line between breweries
 
-    return "\n".join(result)
+    # The last line is the empty separator line, which has no newline of its own
+    return result.getvalue()[:-1]
 
 
 def send_email(subject: str, body: str) -> None:
@@ -262,11 +637,11 @@ def send_email(subject: str, body: str) -> None:
         raise e
 
 
-def _process():
+async def _process():
     logging.info("Searching for beers that match your desired styles...")
 
     # Find matching beers
-    matching_beers = find_matching_beers()
+    matching_beers = await find_matching_beers()
 
     if not matching_beers:
         logging.info("No matching beers found.")
@@ -324,7 +699,7 @@ def main() -> None:
     logger = setup_logging()
 
     try:
-        _process()
+        asyncio.run(_process())
         config = load_config()
         healthcheck_url = config.get("healthcheck_url")
 